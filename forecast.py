@@ -0,0 +1,205 @@
+import math
+import threading
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+SEASON_LEN = 7  # weekly cycle, same signal weekday_bias_for() hard-codes
+WARMUP_SEASONS = 2  # need >1 season so the residual variance isn't trivially zero
+DROP_PROB_BOUNDS = (0.02, 0.98)  # never report a certain drop/rise to the LLM
+
+
+class RouteForecaster:
+    """
+    Incremental additive Holt-Winters model for one route's price series.
+
+    Level, trend and a weekly seasonal profile are exponentially weighted and
+    updated in O(1) per new departure date; only a revised fare for a date
+    already seen triggers a refit over the stored history.
+    """
+
+    def __init__(self, alpha: float = 0.4, beta: float = 0.15, gamma: float = 0.2,
+                 season_len: int = SEASON_LEN):
+        self.alpha = alpha
+        self.beta = beta
+        self.gamma = gamma
+        self.season_len = season_len
+        self._history: Dict[str, float] = {}
+        self._reset()
+
+    def _reset(self):
+        self.level: Optional[float] = None
+        self.trend = 0.0
+        self.season = [0.0] * self.season_len
+        self.resid_var = 0.0
+        self.last_price: Optional[float] = None
+        self.last_date: Optional[str] = None
+        self.n = 0
+        self._last_ord: Optional[int] = None
+        self._warmup: List[float] = []
+        self._warmup_ords: List[int] = []
+
+    def _init_state(self):
+        # Vectorised bootstrap: least-squares fit of a daily slope plus one
+        # dummy per weekday, so gaps in the grid and the weekly shape don't
+        # bias the trend. The level is anchored at the last warm-up point.
+        warm = np.asarray(self._warmup, dtype=float)
+        ords = np.asarray(self._warmup_ords)
+        x = (ords - ords.mean()).astype(float)
+        slots = (ords - 1) % self.season_len  # == date.weekday() for a weekly season
+        design = np.zeros((warm.size, self.season_len + 1))
+        design[:, 0] = x
+        design[np.arange(warm.size), slots + 1] = 1.0
+        coef, *_ = np.linalg.lstsq(design, warm, rcond=None)
+
+        seen = np.bincount(slots, minlength=self.season_len) > 0
+        base = coef[1:][seen].mean()
+        profile = np.where(seen, coef[1:] - base, 0.0)
+        resid = warm - design @ coef
+
+        self.level = float(base + coef[0] * x[-1])
+        self.trend = float(coef[0])
+        self.season = profile.tolist()
+        self.resid_var = float(resid.var())
+        self._warmup = []
+        self._warmup_ords = []
+
+    def update(self, price: float, d: Optional[str] = None):
+        """
+        Feed one price. The seasonal slot and the trend step come from the
+        date, so missing days keep the weekly phase; undated prices are taken
+        to be one day after the previous one.
+        """
+        price = float(price)
+        if d is not None:
+            ord_ = date.fromisoformat(d).toordinal()
+        else:
+            ord_ = 1 if self._last_ord is None else self._last_ord + 1
+        step = 1 if self._last_ord is None else max(1, ord_ - self._last_ord)
+        self.n += 1
+        self.last_price = price
+        self.last_date = d if d is not None else self.last_date
+        self._last_ord = ord_
+
+        if self.level is None:
+            self._warmup.append(price)
+            self._warmup_ords.append(ord_)
+            if len(self._warmup) >= WARMUP_SEASONS * self.season_len:
+                self._init_state()
+            return
+
+        idx = (ord_ - 1) % self.season_len
+        s = self.season[idx]
+        expected = self.level + step * self.trend + s
+        err = price - expected
+
+        prev_level = self.level
+        self.level = self.alpha * (price - s) + (1 - self.alpha) * (self.level + step * self.trend)
+        self.trend = self.beta * (self.level - prev_level) / step + (1 - self.beta) * self.trend
+        self.season[idx] = self.gamma * (price - self.level) + (1 - self.gamma) * s
+        self.resid_var = self.alpha * err * err + (1 - self.alpha) * self.resid_var
+
+    def observe(self, grid: List[Dict[str, Any]]):
+        """
+        Feed dated grid entries. Dates after the last one seen are applied
+        incrementally; a revised fare for a date already seen (or a backfilled
+        earlier date) refits the model over the merged history.
+        """
+        new: Dict[str, float] = {}
+        refit = False
+        for row in grid:
+            d = row.get("date")
+            if d is None:
+                continue
+            price = float(row["price"])
+            old = self._history.get(d)
+            if old is None:
+                if self.last_date is not None and d < self.last_date:
+                    refit = True
+                new[d] = price
+            elif old != price:
+                refit = True
+            self._history[d] = price
+
+        if refit:
+            self._reset()
+            new = self._history
+        for d in sorted(new):
+            self.update(new[d], d)
+
+    @property
+    def ready(self) -> bool:
+        return self.level is not None
+
+    def forecast(self, horizon: int = 3) -> Optional[float]:
+        """Mean forecast over the `horizon` days after the last observation."""
+        if not self.ready:
+            return None
+        total = 0.0
+        for h in range(1, horizon + 1):
+            idx = (self._last_ord + h - 1) % self.season_len
+            total += self.level + h * self.trend + self.season[idx]
+        return total / horizon
+
+    def _forecast_var(self, horizon: int) -> float:
+        """Holt h-step forecast variance, averaged over the horizon."""
+        a, b = self.alpha, self.alpha * self.beta
+        total = 0.0
+        for h in range(1, horizon + 1):
+            total += 1 + (h - 1) * (a * a + a * b * h + b * b * h * (2 * h - 1) / 6.0)
+        return self.resid_var * total / horizon
+
+    def drop_probability(self, horizon: int = 3) -> Optional[float]:
+        """
+        Probability that the deseasonalised price level, averaged over the
+        next `horizon` days, is below the current level, assuming normally
+        distributed forecast errors. The weekly pattern is excluded so a
+        weekend spike in the latest price doesn't read as an expected drop.
+        Clamped to DROP_PROB_BOUNDS.
+        """
+        if not self.ready:
+            return None
+        expected_change = self.trend * (horizon + 1) / 2.0
+        sigma = math.sqrt(max(self._forecast_var(horizon), 1e-9))
+        z = -expected_change / sigma
+        p = 0.5 * (1.0 + math.erf(z / math.sqrt(2.0)))
+        lo, hi = DROP_PROB_BOUNDS
+        return min(hi, max(lo, p))
+
+    def features(self, horizon: int = 3) -> Dict[str, Any]:
+        if not self.ready:
+            return {"forecast_trend": 0.0, "forecast_price": None,
+                    "forecast_level": None, "drop_prob": None}
+        mean = self.forecast(horizon)
+        return {
+            "forecast_trend": self.trend / max(1.0, self.level),
+            "forecast_price": round(mean, 2),
+            "forecast_level": round(self.level + self.trend * (horizon + 1) / 2.0, 2),
+            "drop_prob": round(self.drop_probability(horizon=horizon), 4),
+        }
+
+
+class ForecastStore:
+    """
+    In-process registry of per-route forecasters keyed like the mock data.
+
+    recommend() is sync, so FastAPI runs it in a threadpool; a single lock
+    serialises updates and feature reads across routes.
+    """
+
+    def __init__(self):
+        self._models: Dict[str, RouteForecaster] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, key: str, grid: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Feed new grid entries for `key` and return a snapshot of its features."""
+        with self._lock:
+            model = self._models.get(key)
+            if model is None:
+                model = self._models[key] = RouteForecaster()
+            model.observe(grid)
+            return model.features()
+
+
+forecast_store = ForecastStore()
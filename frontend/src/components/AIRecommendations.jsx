@@ -100,7 +100,7 @@ export default function AIRecommendations({
             <p className="text-xs uppercase tracking-[0.3em] text-slate-400">
               Market snapshot
             </p>
-            <div className="mt-3 grid gap-3 sm:grid-cols-4">
+            <div className="mt-3 grid gap-3 sm:grid-cols-5">
               {[
                 { label: "Monthly min", value: stats.pmin },
                 { label: "25th percentile", value: stats.p25 },
@@ -113,6 +113,14 @@ export default function AIRecommendations({
                       : null,
                   raw: true,
                 },
+                {
+                  label: "Drop chance",
+                  value:
+                    stats.drop_prob !== undefined && stats.drop_prob !== null
+                      ? `${Math.round(stats.drop_prob * 100)}%`
+                      : "n/a",
+                  raw: true,
+                },
               ].map(
                 (item) =>
                   item.value !== undefined &&
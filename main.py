@@ -10,6 +10,8 @@ from google import genai
 from google.genai import types
 from pydantic import BaseModel, Field
 
+from forecast import forecast_store
+
 app = FastAPI(title="FlyWise AI Service", version="0.1.0")
 
 from gemini import router as hotels_router
@@ -184,12 +186,18 @@ def load_mock_prices():
     with open("sample_prices.json","r") as f:
         return json.load(f)
 
-def baseline_score(price, pmin, p25, p50, volatility, weekday_bias):
+def baseline_score(price, pmin, p25, p50, volatility, weekday_bias,
+                   drop_prob=None, forecast_level=None):
     over_min = (price - pmin) / max(1.0, pmin)
     over_p25 = (price - p25) / max(1.0, p25)
     over_med = (price - p50) / max(1.0, p50)
     score = 0.5*over_min + 0.3*over_p25 + 0.2*over_med
     score += 0.2*volatility + 0.05*weekday_bias
+    if drop_prob is not None and forecast_level:
+        # a likely drop penalises windows priced above the forecast level,
+        # i.e. the ones that would gain most from waiting
+        over_fc = max(0.0, (price - forecast_level) / max(1.0, forecast_level))
+        score += drop_prob*over_fc
     return score
 
 def weekday_bias_for(d: date):
@@ -209,7 +217,10 @@ def call_gemini_recommendation(payload: Dict[str, Any]) -> Dict[str, Any]:
     prompt = f"""
 You are FlyWise's travel pricing strategist. Analyze the structured data below and decide
 whether the traveler should BOOK now or WAIT for a better deal. Consider price percentiles,
-trend direction, the top candidate travel windows, and recent Booking.com hotel trends.
+trend direction, the forecast (prices are indexed by departure date, and drop_prob is the
+modelled probability that the underlying fare level, with the weekday pattern removed, keeps
+falling over the next few departure dates; null means not enough data), the top candidate
+travel windows, and recent Booking.com hotel trends.
 Respond with JSON only.
 
 DATA:
@@ -386,10 +397,39 @@ def build_payload_from_itineraries(itineraries: List[Dict[str, Any]], stay_len:
         )
 
     return {
-        "stats": {"pmin": pmin, "p25": p25, "p50": p50, "trend3d": 0.0},
+        "stats": {
+            "pmin": pmin, "p25": p25, "p50": p50, "trend3d": 0.0,
+            "forecast_trend": 0.0, "forecast_price": None,
+            "forecast_level": None, "drop_prob": None,
+        },
         "best_windows": windows,
     }
 
+def rank_windows(
+    grid: List[Dict[str, Any]], month: str, stay_len: int, stats: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Score every departure window in a month grid and return the best three."""
+    y, m = [int(x) for x in month.split("-")]
+    start = date(y, m, 1)
+    windows = []
+    for i in range(0, len(grid) - stay_len):
+        sdate = start + timedelta(days=i)
+        edate = sdate + timedelta(days=stay_len)
+        price = grid[i]["price"]
+        score = baseline_score(
+            price,
+            stats["pmin"],
+            stats["p25"],
+            stats["p50"],
+            volatility=stats["trend3d"],
+            weekday_bias=weekday_bias_for(sdate),
+            drop_prob=stats.get("drop_prob"),
+            forecast_level=stats.get("forecast_level"),
+        )
+        windows.append((score, sdate.isoformat(), edate.isoformat(), price))
+    windows.sort(key=lambda x: x[0])
+    return [{"start": s, "end": e, "price": p} for _, s, e, p in windows[:3]]
+
 @app.post("/recommend", response_model=RecommendResponse)
 def recommend(req: RecommendRequest):
     baseline_payload: Optional[Dict[str, Any]] = None
@@ -422,31 +462,14 @@ def recommend(req: RecommendRequest):
                 (sum(prices[-3:]) / 3 - sum(prices[-6:-3]) / 3)
                 / max(1.0, sum(prices[-6:-3]) / 3)
             )
-
-        y, m = [int(x) for x in req.month.split("-")]
-        start = date(y, m, 1)
-        windows = []
-        for i in range(0, len(grid) - req.stay_len):
-            sdate = start + timedelta(days=i)
-            edate = sdate + timedelta(days=req.stay_len)
-            price = grid[i]["price"]
-            score = baseline_score(
-                price,
-                pmin,
-                p25,
-                p50,
-                volatility=trend3d,
-                weekday_bias=weekday_bias_for(sdate),
-            )
-            windows.append((score, sdate.isoformat(), edate.isoformat(), price))
-        windows.sort(key=lambda x: x[0])
-        top = windows[:3]
+        stats = {
+            "pmin": pmin, "p25": p25, "p50": p50, "trend3d": trend3d,
+            **forecast_store.observe(key, grid),
+        }
 
         baseline_payload = {
-            "stats": {"pmin": pmin, "p25": p25, "p50": p50, "trend3d": trend3d},
-            "best_windows": [
-                {"start": s, "end": e, "price": p} for _, s, e, p in top
-            ],
+            "stats": stats,
+            "best_windows": rank_windows(grid, req.month, req.stay_len, stats),
         }
         source = "mock"
 
@@ -0,0 +1,145 @@
+import threading
+import time
+from datetime import date, timedelta
+
+import pytest
+
+from forecast import DROP_PROB_BOUNDS, SEASON_LEN, ForecastStore, RouteForecaster
+
+WEEKLY = [-4.0, -2.0, 0.0, 1.0, 3.0, 8.0, -6.0]
+
+
+def _feed(model, prices):
+    for p in prices:
+        model.update(p)
+    return model
+
+
+def test_linear_series_one_step_forecast():
+    model = _feed(RouteForecaster(), [100 + 10 * i for i in range(20)])
+    assert model.forecast(1) == pytest.approx(300.0)
+    assert model.trend == pytest.approx(10.0)
+
+
+def test_linear_series_forecast_right_after_warmup():
+    n = 2 * SEASON_LEN
+    model = _feed(RouteForecaster(), [100 + 10 * i for i in range(n)])
+    assert model.level == pytest.approx(100 + 10 * (n - 1))
+    assert model.forecast(1) == pytest.approx(100 + 10 * n)
+    assert model.resid_var == pytest.approx(0.0, abs=1e-9)
+
+
+def test_seasonal_series_one_step_forecast():
+    series = [200 + 2 * i + WEEKLY[i % SEASON_LEN] for i in range(30)]
+    model = _feed(RouteForecaster(), series)
+    assert model.forecast(1) == pytest.approx(200 + 2 * 30 + WEEKLY[30 % SEASON_LEN])
+    assert model.season == pytest.approx(WEEKLY)
+
+
+def test_drop_probability_ignores_weekly_spike():
+    # Flat fares with a weekend spike as the latest observation.
+    series = [100 + WEEKLY[i % SEASON_LEN] for i in range(27)]
+    model = _feed(RouteForecaster(), series)
+    assert series[-1] == 108.0
+    assert model.drop_probability() == pytest.approx(0.5, abs=0.05)
+
+
+def test_drop_probability_follows_trend():
+    falling = _feed(RouteForecaster(), [300 - 3 * i + (i % 2) for i in range(28)])
+    rising = _feed(RouteForecaster(), [100 + 3 * i + (i % 2) for i in range(28)])
+    assert falling.drop_probability() > 0.9
+    assert rising.drop_probability() < 0.1
+
+
+def test_observe_skips_dateless_rows():
+    model = RouteForecaster()
+    model.observe([{"price": 100}, {"price": 101}])
+    model.observe([{"price": 102}])
+    assert model.n == 0
+
+
+def test_store_concurrent_observe_feeds_grid_once():
+    grid = [{"date": f"2025-12-{i + 1:02d}", "price": 100 + i} for i in range(28)]
+    store = ForecastStore()
+    threads = [threading.Thread(target=store.observe, args=("A->B:2025-12", grid))
+               for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert store._models["A->B:2025-12"].n == len(grid)
+
+
+def _sample_grid(n=31):
+    return [
+        {"date": f"2025-12-{i + 1:02d}", "price": 800 + 2 * i + 15 * WEEKLY[i % SEASON_LEN] + (i % 3)}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("split", [3, 14, 20])
+def test_incremental_matches_batch(split):
+    grid = _sample_grid()
+    batch = RouteForecaster()
+    batch.observe(grid)
+    chunked = RouteForecaster()
+    chunked.observe(grid[:split])
+    chunked.observe(grid)  # overlapping rows must be skipped, not re-fed
+
+    assert chunked.n == batch.n
+    assert chunked.level == pytest.approx(batch.level)
+    assert chunked.trend == pytest.approx(batch.trend)
+    assert chunked.season == pytest.approx(batch.season)
+    assert chunked.resid_var == pytest.approx(batch.resid_var)
+    assert chunked.features() == batch.features()
+
+
+def test_fit_and_score_under_a_millisecond_per_route():
+    grid = _sample_grid()
+    RouteForecaster().observe(grid)  # warm numpy up
+    best = float("inf")
+    for _ in range(20):
+        start = time.perf_counter()
+        model = RouteForecaster()
+        model.observe(grid)
+        model.features()
+        best = min(best, time.perf_counter() - start)
+    assert best < 1e-3
+
+
+def test_missing_day_keeps_weekly_phase():
+    days = [date(2025, 12, 1) + timedelta(days=i) for i in range(30)]
+    grid = [
+        {"date": d.isoformat(), "price": 200 + 2 * i + WEEKLY[d.weekday()]}
+        for i, d in enumerate(days)
+    ]
+    gappy = RouteForecaster()
+    gappy.observe([row for i, row in enumerate(grid) if i not in (5, 17)])
+
+    nxt = days[-1] + timedelta(days=1)
+    assert gappy.forecast(1) == pytest.approx(200 + 2 * 30 + WEEKLY[nxt.weekday()])
+    assert gappy.season == pytest.approx(WEEKLY)
+
+
+def test_revised_fares_refit_the_model():
+    dates = [f"2025-12-{i + 1:02d}" for i in range(28)]
+    rising = [{"date": d, "price": 100 + 3 * i} for i, d in enumerate(dates)]
+    falling = [{"date": d, "price": 181 - 3 * i} for i, d in enumerate(dates)]
+
+    store = ForecastStore()
+    first = store.observe("A->B:2025-12", rising)
+    revised = store.observe("A->B:2025-12", falling)
+
+    fresh = RouteForecaster()
+    fresh.observe(falling)
+    assert revised != first
+    assert revised == fresh.features()
+    assert store._models["A->B:2025-12"].n == len(dates)
+
+
+def test_drop_probability_clamped_when_residuals_vanish():
+    falling = _feed(RouteForecaster(), [300 - 3 * i for i in range(28)])
+    rising = _feed(RouteForecaster(), [100 + 3 * i for i in range(28)])
+    assert falling.resid_var == pytest.approx(0.0, abs=1e-9)
+    assert falling.drop_probability() == DROP_PROB_BOUNDS[1]
+    assert rising.drop_probability() == DROP_PROB_BOUNDS[0]
@@ -0,0 +1,39 @@
+import os
+
+import pytest
+
+pytest.importorskip("google.genai")
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+import main  # noqa: E402
+
+
+def _grid():
+    # Dec 2025 starts on a Monday: the 6th is a Saturday, the 10th a Wednesday.
+    prices = [120.0] * 31
+    prices[5] = 100.0
+    prices[9] = 100.3
+    return [{"date": f"2025-12-{i + 1:02d}", "price": p} for i, p in enumerate(prices)]
+
+
+def _stats(drop_prob):
+    return {
+        "pmin": 100.0, "p25": 100.3, "p50": 120.0, "trend3d": 0.0,
+        "forecast_level": 100.0, "drop_prob": drop_prob,
+    }
+
+
+def test_drop_prob_changes_top_window():
+    unlikely = main.rank_windows(_grid(), "2025-12", 7, _stats(0.02))
+    likely = main.rank_windows(_grid(), "2025-12", 7, _stats(0.98))
+
+    # The weekday window wins on weekend bias until a likely drop penalises
+    # its fare sitting above the forecast level.
+    assert unlikely[0]["start"] == "2025-12-10"
+    assert likely[0]["start"] == "2025-12-06"
+
+
+def test_missing_forecast_leaves_ranking_alone():
+    without = main.rank_windows(_grid(), "2025-12", 7, {**_stats(None), "forecast_level": None})
+    assert without == main.rank_windows(_grid(), "2025-12", 7, _stats(None))
+    assert without[0]["start"] == "2025-12-10"